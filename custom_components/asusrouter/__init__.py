@@ -7,10 +7,12 @@ _LOGGER = logging.getLogger(__name__)
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    CONF_HOST,
     CONF_SCAN_INTERVAL,
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 
 from .const import (
     CONF_CACHE_TIME,
@@ -23,6 +25,8 @@ from .const import (
     DATA_ASUSROUTER,
     DOMAIN,
     PLATFORMS,
+    STORAGE_LABELS_KEY,
+    STORAGE_LABELS_VERSION,
 )
 from .migrate import DEPRECATED, MOVE_TO_OPTIONS
 from .router import AsusRouterObj
@@ -76,6 +80,20 @@ async def async_unload_entry(
     return unload
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+) -> None:
+    """Remove data saved for the entry"""
+
+    store = Store(
+        hass,
+        STORAGE_LABELS_VERSION,
+        STORAGE_LABELS_KEY.format(DOMAIN, entry.unique_id or entry.data[CONF_HOST]),
+    )
+    await store.async_remove()
+
+
 async def update_listener(
     hass: HomeAssistant,
     entry: ConfigEntry,
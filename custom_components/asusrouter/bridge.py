@@ -5,7 +5,12 @@ from __future__ import annotations
 import logging
 _LOGGER = logging.getLogger(__name__)
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+from functools import partial
+from itertools import product
+import time
 from typing import Any
 
 from homeassistant.const import (
@@ -18,6 +23,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from asusrouter import (
@@ -37,10 +43,13 @@ from .const import (
     DEFAULT_ENABLE_MONITOR,
     DEFAULT_PORT,
     DEFAULT_VERIFY_SSL,
+    DOMAIN,
     SENSORS_MISC,
     SENSORS_NETWORK_STAT,
     SENSORS_PORTS,
     SENSORS_RAM,
+    SENSORS_TIER_FAST,
+    SENSORS_TIER_SLOW,
     SENSORS_TYPE_CPU,
     SENSORS_TYPE_MISC,
     SENSORS_TYPE_NETWORK_STAT,
@@ -48,6 +57,9 @@ from .const import (
     SENSORS_TYPE_RAM,
     SENSORS_TYPE_WAN,
     SENSORS_WAN,
+    STORAGE_LABELS_DELAY,
+    STORAGE_LABELS_KEY,
+    STORAGE_LABELS_VERSION,
 )
 
 
@@ -58,16 +70,47 @@ class ARBridge():
         self,
         hass: HomeAssistant,
         configs: dict[str, Any],
-        options: dict[str, Any] = dict(),
+        options: dict[str, Any] | None = None,
     ) -> None:
         """Initialize bridge"""
 
         super().__init__()
-        self._configs = configs.copy()
-        self._configs.update(options)
-        self._api = self._get_api(self._configs)
-        self._host = self._configs[CONF_HOST]
+        self._hass = hass
+        merged = {**configs, **(options or {})}
+        self._api = self._get_api(merged)
+        self._host = merged[CONF_HOST]
+        self._cache_time = merged.get(CONF_CACHE_TIME, DEFAULT_CACHE_TIME)
         self._identity: AsusDevice | None = None
+        self._firmware: str | None = None
+        self._mac: str | None = None
+        self._model: str | None = None
+        self._serial: str | None = None
+        self._vendor: str | None = None
+        self._available_sensors: dict[str, dict[str, Any]] | None = None
+
+        # Raw ports data is shared between the sensors list and the updates
+        self._ports_raw: dict[str, dict[str, int]] | None = None
+        self._ports_time: float = 0.0
+
+        # Data requested during the current update cycle
+        self._tick_cache: dict[str, asyncio.Future] = {}
+
+        # Shared request for CPU, RAM, network and WAN data
+        self._bulk: asyncio.Future | None = None
+        self._bulk_time: float = 0.0
+
+        # Shared request for misc and ports data
+        self._misc: asyncio.Future | None = None
+
+        # Boot time only changes on reboot, parse it only when changed
+        self._boottime_raw: str | None = None
+        self._boottime: datetime | None = None
+
+        # CPU labels are fixed for the firmware and saved between restarts.
+        # Network labels depend on the device settings and are not saved
+        self._labels: dict[str, list[str]] = {}
+        self._labels_firmware: str | None = None
+        self._labels_store: Store | None = None
 
 
     @staticmethod
@@ -100,11 +143,15 @@ class ARBridge():
     async def async_connect(self) -> None:
         """Connect to the device"""
 
+        # The library creates and closes its own session. Shared Home Assistant
+        # session cannot be used, since it would be closed on cleanup
         try:
             await self._api.async_connect()
             self._identity = await self._async_get_device_identity()
-        except AsusRouterError as ex:
-            raise ex
+            self._set_identity()
+            self.invalidate_sensor_cache()
+        except AsusRouterError:
+            raise
         except Exception as ex:
             raise ConfigEntryNotReady from ex
 
@@ -127,6 +174,16 @@ class ARBridge():
         return await self._api.async_get_identity()
 
 
+    def _set_identity(self) -> None:
+        """Save identity values, since they are fixed for the connection"""
+
+        self._firmware = self._identity.firmware()
+        self._mac = self._identity.mac
+        self._model = self._identity.model
+        self._serial = self._identity.serial
+        self._vendor = self._identity.brand
+
+
     async def async_get_connected_devices(self) -> dict[str, ConnectedDevice]:
         """Get dict of connected devices"""
 
@@ -138,69 +195,207 @@ class ARBridge():
         return api_devices
 
 
-    async def get_firmware(self) -> str | None:
-        """Get firmware information"""
+    @property
+    def firmware(self) -> str | None:
+        """Device firmware"""
 
-        return self._identity.firmware()
+        return self._firmware
 
 
-    async def get_mac(self) -> str | None:
-        """Get MAC information"""
+    @property
+    def mac(self) -> str | None:
+        """Device MAC"""
 
-        return self._identity.mac
+        return self._mac
 
 
-    async def get_serial(self) -> str | None:
-        """Get serial information"""
+    @property
+    def serial(self) -> str | None:
+        """Device serial"""
 
-        return self._identity.serial
+        return self._serial
 
 
-    async def get_model(self) -> str | None:
-        """Get model information"""
+    @property
+    def model(self) -> str | None:
+        """Device model"""
 
-        return self._identity.model
+        return self._model
 
 
-    async def get_vendor(self) -> str | None:
-        """Get vendor information"""
+    @property
+    def vendor(self) -> str | None:
+        """Device vendor"""
 
-        return self._identity.brand
+        return self._vendor
 
 
     async def async_get_available_sensors(self) -> dict[str, dict[str, Any]]:
         """Get a dictionary of available sensors"""
 
+        # Available sensors only change with the device reboot / reconnect
+        if self._available_sensors is not None:
+            return self._available_sensors
+
+        await self._async_load_labels()
+
+        # Label helpers handle their own errors, so a single failure
+        # will not cancel the others
+        (cpu, network_stat), ports = await asyncio.gather(
+            self._get_main_sensors(),
+            self._get_ports_sensors(),
+        )
+
         sensors_types = {
             SENSORS_TYPE_CPU: {
-                "sensors": await self._get_cpu_sensors(),
-                "method": self._get_cpu
+                "sensors": cpu,
+                "method": self._bulk_slice(self._get_cpu),
+                "tier": SENSORS_TIER_FAST,
             },
             SENSORS_TYPE_RAM: {
                 "sensors": SENSORS_RAM,
-                "method": self._get_ram
+                "method": self._bulk_slice(self._get_ram),
+                "tier": SENSORS_TIER_FAST,
             },
             SENSORS_TYPE_NETWORK_STAT: {
-                "sensors": await self._get_network_stat_sensors(),
-                "method": self._get_network_stat
+                "sensors": network_stat,
+                "method": self._bulk_slice(self._get_network_stat),
+                "tier": SENSORS_TIER_FAST,
             },
+            # Misc and ports are always updated in the same slow batch,
+            # so they share a single request with `_get_misc_bulk`
             SENSORS_TYPE_MISC: {
                 "sensors": SENSORS_MISC,
-                "method": self._get_misc
+                "method": self._get_misc,
+                "tier": SENSORS_TIER_SLOW,
             },
             SENSORS_TYPE_PORTS: {
-                "sensors": await self._get_ports_sensors(),
-                "method": self._get_ports
+                "sensors": ports,
+                "method": self._get_ports,
+                "tier": SENSORS_TIER_SLOW,
             },
             SENSORS_TYPE_WAN: {
                 "sensors": SENSORS_WAN,
-                "method": self._get_wan
+                "method": self._bulk_slice(self._get_wan),
+                "tier": SENSORS_TIER_FAST,
             },
         }
+
+        # Every sensor type is requested at most once per update cycle
+        for sensor_type, sensor_def in sensors_types.items():
+            sensor_def["method"] = partial(self._cached, sensor_type, sensor_def["method"])
+
+        self._available_sensors = sensors_types
         return sensors_types
 
 
+    def invalidate_sensor_cache(self) -> None:
+        """Force the available sensors to be found again"""
+
+        self._available_sensors = None
+
+
+    async def async_fetch_all(
+        self,
+        methods: dict[str, Callable[[], Awaitable[dict[str, Any]]]],
+    ) -> dict[str, Any]:
+        """Get data for all the provided sensor types at once.
+
+        Results of the failed methods are returned as `UpdateFailed`.
+        Cancellation is raised, not returned as data"""
+
+        results = await asyncio.gather(
+            *(method() for method in methods.values()),
+            return_exceptions = True,
+        )
+
+        data = {}
+        for sensor_type, result in zip(methods, results):
+            if (isinstance(result, BaseException)
+                and not isinstance(result, Exception)
+            ):
+                raise result
+            if (isinstance(result, Exception)
+                and not isinstance(result, UpdateFailed)
+            ):
+                result = UpdateFailed(result)
+            data[sensor_type] = result
+
+        return data
+
+
+    def begin_tick(self) -> None:
+        """Start a new update cycle"""
+
+        self._tick_cache.clear()
+
+
+    async def _cached(
+        self,
+        key: str,
+        method: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Get data only once per update cycle"""
+
+        if key not in self._tick_cache:
+            self._tick_cache[key] = asyncio.ensure_future(method())
+
+        return await asyncio.shield(self._tick_cache[key])
+
+
     ### GET DATA FROM DEVICE ->
+    async def _get_bulk(self) -> None:
+        """Get CPU, RAM, network and WAN data with a single request.
+
+        Concurrent calls share the same request. Successful data
+        is reused for `cache_time` seconds"""
+
+        now = time.monotonic()
+        if (self._bulk is None
+            or (self._bulk.done()
+                and (self._bulk.cancelled()
+                    or self._bulk.exception() is not None
+                    or now - self._bulk_time > self._cache_time
+                )
+            )
+        ):
+            self._bulk = asyncio.ensure_future(self._api.async_monitor_main())
+            self._bulk_time = now
+
+        await asyncio.shield(self._bulk)
+
+
+    async def _get_misc_bulk(self) -> None:
+        """Get misc and ports data with a single request.
+
+        Concurrent calls share the same request, since the library
+        does not wait for a request already in progress"""
+
+        if (self._misc is None
+            or self._misc.done()
+        ):
+            self._misc = asyncio.ensure_future(self._api.async_monitor_misc())
+
+        await asyncio.shield(self._misc)
+
+
+    def _bulk_slice(
+        self,
+        method: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> Callable[[], Awaitable[dict[str, Any]]]:
+        """Wrap a method to read its data from the shared bulk request"""
+
+        async def _get_slice() -> dict[str, Any]:
+            try:
+                await self._get_bulk()
+            except (OSError, ValueError) as ex:
+                raise UpdateFailed(ex) from ex
+
+            return await method()
+
+        return _get_slice
+
+
     async def _get_cpu(self) -> dict[str, Any]:
         """Get CPU data from the device"""
 
@@ -237,9 +432,13 @@ class ARBridge():
     async def _get_misc(self) -> dict[str, Any]:
         """Get MISC sensors from the device"""
 
-        data = dict()
-        await self._api.async_monitor_misc()
-        data["boottime"] = datetime.fromisoformat(self._api.boottime)
+        data = {}
+        await self._get_misc_bulk()
+        boottime = self._api.boottime
+        if boottime != self._boottime_raw:
+            self._boottime = datetime.fromisoformat(boottime)
+            self._boottime_raw = boottime
+        data["boottime"] = self._boottime
 
         return data
 
@@ -247,24 +446,40 @@ class ARBridge():
     async def _get_ports(self) -> dict[str, dict[str, int]]:
         """Get ports status from the device"""
 
-        data = dict()
+        data = {}
         try:
-            raw = await self._api.async_get_ports()
-
-            for type in SENSORS_PORTS:
-                if type in raw:
-                    data["{}_total".format(type)] = 0
-                    for port in raw[type]:
-                        data["{}_{}".format(type, port)] = raw[type][port]
-                        data["{}_total".format(type)] += raw[type][port]
-                    if data["{}_total".format(type)] > 0:
-                        data[type] = True
+            raw = await self._ports_fetch()
         except (OSError, ValueError) as ex:
             raise UpdateFailed(ex) from ex
 
+        for type in SENSORS_PORTS:
+            if type not in raw:
+                continue
+            ports = raw[type]
+            total = sum(ports.values())
+            # Port type is reported only when at least one port is connected
+            if total > 0:
+                data[type] = True
+            data[f"{type}_total"] = total
+            data.update((f"{type}_{port}", value) for port, value in ports.items())
+
         return data
 
 
+    async def _ports_fetch(self) -> dict[str, dict[str, int]]:
+        """Get raw ports data. Cached for `cache_time` seconds"""
+
+        now = time.monotonic()
+        if (self._ports_raw is None
+            or now - self._ports_time > self._cache_time
+        ):
+            await self._get_misc_bulk()
+            self._ports_raw = await self._api.async_get_ports()
+            self._ports_time = now
+
+        return self._ports_raw
+
+
     async def _get_wan(self) -> dict[str, Any]:
         """Get WAN data from the device"""
 
@@ -278,14 +493,28 @@ class ARBridge():
 
 
     ### GET SENSORS LIST ->
+    async def _get_main_sensors(self) -> tuple[list[str], list[str]]:
+        """Get the available CPU and network stat sensors.
+
+        Both use the same library monitor, which does not wait for
+        a request already in progress, so they are found one by one"""
+
+        cpu = await self._get_cpu_sensors()
+        network_stat = await self._get_network_stat_sensors()
+        return cpu, network_stat
+
+
     async def _get_cpu_sensors(self):
         """Get the available CPU sensors"""
 
         try:
-            sensors = await self._api.async_get_cpu_labels()
-            _LOGGER.debug("Available CPU sensors: {}".format(sensors))
+            sensors = self._labels.get(SENSORS_TYPE_CPU)
+            if sensors is None:
+                sensors = await self._api.async_get_cpu_labels()
+                self._save_labels(SENSORS_TYPE_CPU, sensors)
+            _LOGGER.debug("Available CPU sensors: %s", sensors)
         except Exception as ex:
-            _LOGGER.warning("Cannot get available CPU sensors for {}: {}".format(self._host, ex))
+            _LOGGER.warning("Cannot get available CPU sensors for %s: %s", self._host, ex)
             sensors = ["total"]
         return sensors
 
@@ -296,12 +525,10 @@ class ARBridge():
         try:
             sensors = []
             labels = await self.async_get_network_interfaces()
-            for label in labels:
-                for el in SENSORS_NETWORK_STAT:
-                    sensors.append("{}_{}".format(label, el))
-            _LOGGER.debug("Available network stat sensors: {}".format(sensors))
+            sensors = [f"{label}_{el}" for label, el in product(labels, SENSORS_NETWORK_STAT)]
+            _LOGGER.debug("Available network stat sensors: %s", sensors)
         except Exception as ex:
-            _LOGGER.warning("Cannot get available network stat sensors for {}: {}".format(self._host, ex))
+            _LOGGER.warning("Cannot get available network stat sensors for %s: %s", self._host, ex)
         return sensors
 
 
@@ -310,17 +537,61 @@ class ARBridge():
 
         try:
             sensors = []
-            data = await self._api.async_get_ports()
+            data = await self._ports_fetch()
             for type in SENSORS_PORTS:
-                if type in data:
-                    sensors.append(type)
-                    sensors.append("{}_total".format(type))
-                    for port in data[type]:
-                        sensors.append("{}_{}".format(type, port))
-            _LOGGER.debug("Available ports sensors: {}".format(sensors))
+                if type not in data:
+                    continue
+                sensors.append(type)
+                sensors.append(f"{type}_total")
+                sensors.extend(f"{type}_{port}" for port in data[type])
+            _LOGGER.debug("Available ports sensors: %s", sensors)
         except Exception as ex:
-            _LOGGER.warning("Cannot get available ports sensors for {}: {}".format(self._host, ex))
+            _LOGGER.warning("Cannot get available ports sensors for %s: %s", self._host, ex)
         return sensors
+
+
+    async def _async_load_labels(self) -> None:
+        """Load CPU labels saved for the current firmware of the device"""
+
+        if (self._labels_firmware is not None
+            and self._labels_firmware == self._firmware
+        ):
+            return
+
+        self._labels = {}
+        self._labels_firmware = self._firmware
+        if self._labels_store is None:
+            self._labels_store = Store(
+                self._hass,
+                STORAGE_LABELS_VERSION,
+                STORAGE_LABELS_KEY.format(DOMAIN, self._serial or self._host),
+            )
+
+        data = await self._labels_store.async_load()
+        if (data
+            and data.get("firmware") == self._firmware
+        ):
+            labels = data.get("labels", {})
+            if SENSORS_TYPE_CPU in labels:
+                self._labels[SENSORS_TYPE_CPU] = labels[SENSORS_TYPE_CPU]
+
+
+    def _save_labels(
+        self,
+        key: str,
+        labels: list[str],
+    ) -> None:
+        """Save labels found on the device"""
+
+        self._labels[key] = labels
+        if self._labels_store is not None:
+            self._labels_store.async_delay_save(
+                lambda: {
+                    "firmware": self._labels_firmware,
+                    "labels": self._labels,
+                },
+                STORAGE_LABELS_DELAY,
+            )
     ### <- GET SENSORS LIST
 
 
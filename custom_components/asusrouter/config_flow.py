@@ -5,7 +5,13 @@ from __future__ import annotations
 import logging
 _LOGGER = logging.getLogger(__name__)
 
+import asyncio
+from collections.abc import Callable, Mapping
+from functools import wraps
+import ipaddress
 import socket
+import time
+from types import MappingProxyType
 from typing import Any
 import voluptuous as vol
 
@@ -51,6 +57,8 @@ from .const import (
     DEFAULT_SSL,
     DEFAULT_USERNAME,
     DEFAULT_VERIFY_SSL,
+    DNS_TTL,
+    DNS_TTL_NEGATIVE,
     DOMAIN,
     RESULT_CONNECTION_REFUSED,
     RESULT_ERROR,
@@ -65,74 +73,150 @@ from .const import (
 from .bridge import ARBridge
 
 
+# Login errors which keep the user on the credentials step
+_NON_FATAL_LOGIN_ERRORS = frozenset({RESULT_WRONG_CREDENTIALS, RESULT_LOGIN_BLOCKED})
+
+# Read-only default for mapping arguments
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Resolved hostnames: hostname -> (expiration time, IP address)
+_DNS_CACHE: dict[str, tuple[float, str | None]] = {}
+
+
 def _check_host(
     host: str,
 ) -> str | None:
     """Get the IP address for the hostname"""
 
+    now = time.monotonic()
+
+    # Remove expired entries, so only recent hostnames are kept
+    for name, (expires, _) in list(_DNS_CACHE.items()):
+        if expires <= now:
+            _DNS_CACHE.pop(name, None)
+
+    cached = _DNS_CACHE.get(host)
+    if cached is not None:
+        return cached[1]
+
     try:
-        return socket.gethostbyname(host)
-    except socket.gaierror:
-        return None
+        # IPv4 only, so no AAAA lookup is made
+        infos = socket.getaddrinfo(host, None, socket.AF_INET, socket.SOCK_STREAM)
+        ip = infos[0][4][0]
+        ttl = DNS_TTL
+    # `socket.gaierror` is a subclass of `OSError`
+    except OSError:
+        ip = None
+        ttl = DNS_TTL_NEGATIVE
+
+    _DNS_CACHE[host] = (now + ttl, ip)
+    return ip
+
+
+# Hostname resolutions in progress
+_INFLIGHT: dict[str, asyncio.Future[str | None]] = {}
+
+
+async def _async_resolve_host(
+    hass: HomeAssistant,
+    host: str,
+) -> str | None:
+    """Get the IP address for the hostname.
+
+    Concurrent calls for the same hostname share a single lookup"""
+
+    future = _INFLIGHT.get(host)
+    if future is None:
+        future = hass.async_add_executor_job(_check_host, host)
+        _INFLIGHT[host] = future
+        future.add_done_callback(lambda _: _INFLIGHT.pop(host, None))
+
+    return await asyncio.shield(future)
 
 
 def _check_errors(
-    errors: dict[str, Any],
+    errors: Mapping[str, Any],
 ) -> bool:
     """Check for errors"""
 
-    if ("base" in errors
-        and errors["base"] != RESULT_SUCCESS
-        and errors["base"] != str()
-    ):
-        return True
-
-    return False
+    error = errors.get("base")
+    return (error is not None
+        and error != ""
+        and error != RESULT_SUCCESS
+    )
 
 
 async def _async_get_network_interfaces(
     hass: HomeAssistant,
     configs: dict[str, Any],
-    options: dict[str, Any] = dict(),
+    options: Mapping[str, Any] = _EMPTY,
+    api: ARBridge | None = None,
 ) -> list[str]:
-    """Return list of possible to monitor network interfaces"""
+    """Return list of possible to monitor network interfaces.
 
-    api = ARBridge(hass, configs, options)
+    Provided bridge is not disconnected"""
+
+    reuse = api is not None
+    if not reuse:
+        api = ARBridge(hass, configs, options)
 
     try:
-        labels = await api.async_get_network_interfaces()
-        await api.async_disconnect()
-        return labels
+        return await api.async_get_network_interfaces()
     except Exception as ex:
-        _LOGGER.debug("Cannot get available network stat sensors for {}: {}".format(configs[CONF_HOST], ex))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Cannot get available network stat sensors for %s: %s", configs[CONF_HOST], ex)
         return DELAULT_INTERFACES
+    finally:
+        if not reuse:
+            await _async_close_bridge(api)
+
+
+async def _async_close_bridge(
+    api: ARBridge | None,
+) -> None:
+    """Disconnect the bridge used by the flow.
+
+    Errors are only logged, so they never block the flow result"""
+
+    if api is None:
+        return
+
+    try:
+        await api.async_disconnect()
+    except Exception as ex:
+        _LOGGER.debug("Cannot disconnect from the device: %s", ex)
+    # Logout does not always close the session, so it is closed here
+    finally:
+        try:
+            await api.async_clean()
+        except Exception as ex:
+            _LOGGER.debug("Cannot close the session to the device: %s", ex)
 
 
 async def _async_check_connection(
     hass: HomeAssistant,
     configs: dict[str, Any],
-    options: dict[str, Any] = dict(),
+    options: Mapping[str, Any] = _EMPTY,
     simple: bool = False,
 ) -> dict[str, Any]:
     """Check connection to the device with provided configurations"""
 
     step_type = STEP_TYPE_COMPLETE
 
-    configs_to_use = configs.copy()
-    configs_to_use.update(options)
-    if not CONF_HOST in configs_to_use:
+    configs_to_use = {**configs, **options} if options else dict(configs)
+    if CONF_HOST not in configs_to_use:
         return {
             "errors": RESULT_ERROR,
         }
     host = configs_to_use[CONF_HOST]
 
-    result = dict()
+    result = {}
 
     if simple:
         configs_to_use.update(SIMPLE_SETUP_PARAMETERS["ssl"] if configs_to_use[CONF_SSL] else SIMPLE_SETUP_PARAMETERS["no_ssl"])
         step_type = STEP_TYPE_SIMPLE
 
-        _LOGGER.debug("Setup ({}) initiated".format(step_type))
+        _LOGGER.debug("Setup (%s) initiated", step_type)
 
     api = ARBridge(hass, configs_to_use)
 
@@ -140,52 +224,85 @@ async def _async_check_connection(
         await api.async_connect()
     # Credentials error
     except AsusRouterLoginError:
-        _LOGGER.error("Error during connection to '{}'. Wrong credentials".format(host))
-        return {
+        _LOGGER.error("Error during connection to '%s'. Wrong credentials", host)
+        result = {
             "errors": RESULT_WRONG_CREDENTIALS,
         }
     # Login blocked by the device
     except AsusRouterLoginBlockError as ex:
-        _LOGGER.error("Device '{}' has reported block for the login (to many wrong attempts were made). Please try again in {} seconds".format(host, ex.timeout))
-        return {
+        _LOGGER.error("Device '%s' has reported block for the login (to many wrong attempts were made). Please try again in %s seconds", host, ex.timeout)
+        result = {
             "errors": RESULT_LOGIN_BLOCKED,
         }
     # Connection refused
     except AsusRouterConnectionError as ex:
         if simple:
-            _LOGGER.debug("Simplified setup failed for {}. Switching to the complete mode. Original exception of type {}: {}".format(host, type(ex), ex))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Simplified setup failed for %s. Switching to the complete mode. Original exception of type %s: %s", host, ex.__class__.__name__, ex)
         else:
-            _LOGGER.error("Connection refused by {}. Check SSL and port settings. Original exception: {}".format(host, ex))
-        return {
+            _LOGGER.error("Connection refused by %s. Check SSL and port settings. Original exception: %s", host, ex)
+        result = {
             "errors": RESULT_CONNECTION_REFUSED,
         }
     # Anything else
     except Exception as ex:
         if simple:
-            _LOGGER.debug("Simplified setup failed for {}. Switching to the complete mode. Original exception of type {}: {}".format(host, type(ex), ex))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Simplified setup failed for %s. Switching to the complete mode. Original exception of type %s: %s", host, ex.__class__.__name__, ex)
         else:
-            _LOGGER.error("Unknown error of type '{}' during connection to {}: {}".format(type(ex), host, ex))
-        return {
+            _LOGGER.error("Unknown error of type '%s' during connection to %s: %s", ex.__class__.__name__, host, ex)
+        result = {
             "errors": RESULT_UNKNOWN,
         }
-    # Cleanup, so no unclosed sessions will be reported
-    finally:
+    # Cancelled, cleanup and pass it further
+    except BaseException:
         await api.async_clean()
+        raise
 
-    result["unique_id"] = await api.get_serial()
-    await api.async_disconnect()
-    for item in configs:
-        configs_to_use.pop(item)
+    # Cleanup, so no unclosed sessions will be reported
+    if "errors" in result:
+        await api.async_clean()
+        return result
 
-    result["configs"] = configs_to_use
+    result["unique_id"] = api.serial
+    # Connected bridge is reused by the flow and should be closed by it
+    result["api"] = api
+    # Only the values which are not part of the configs are returned
+    discard = configs.keys()
+    result["configs"] = {k: v for k, v in configs_to_use.items() if k not in discard}
 
-    _LOGGER.debug("Setup ({}) successful".format(step_type))
+    _LOGGER.debug("Setup (%s) successful", step_type)
 
     return result
 
 
+def _memoize_form(
+    create_form: Callable[[Mapping[str, Any]], vol.Schema],
+) -> Callable[[Mapping[str, Any]], vol.Schema]:
+    """Reuse the form schema created for the empty user input.
+
+    Forms with user input are always created fresh, so no user values
+    (e.g. passwords) are kept between the flows"""
+
+    base: vol.Schema | None = None
+
+    @wraps(create_form)
+    def wrapper(
+        user_input: Mapping[str, Any] = _EMPTY,
+    ) -> vol.Schema:
+        nonlocal base
+        if user_input:
+            return create_form(user_input)
+        if base is None:
+            base = create_form(_EMPTY)
+        return base
+
+    return wrapper
+
+
+@_memoize_form
 def _create_form_discovery(
-    user_input: dict[str, Any] = dict(),
+    user_input: Mapping[str, Any] = _EMPTY,
 ) -> vol.Schema:
     """Create a form for the 'discovery' step"""
 
@@ -201,8 +318,9 @@ def _create_form_discovery(
     return vol.Schema(schema)
 
 
+@_memoize_form
 def _create_form_credentials(
-    user_input: dict[str, Any] = dict(),
+    user_input: Mapping[str, Any] = _EMPTY,
 ) -> vol.Schema:
     """Create a form for the 'credentials' step"""
 
@@ -230,8 +348,9 @@ def _create_form_credentials(
     return vol.Schema(schema)
 
 
+@_memoize_form
 def _create_form_device(
-    user_input: dict[str, Any] = dict(),
+    user_input: Mapping[str, Any] = _EMPTY,
 ) -> vol.Schema:
     """Create a form for the 'device' step"""
 
@@ -277,8 +396,9 @@ def _create_form_device(
     return vol.Schema(schema)
 
 
+@_memoize_form
 def _create_form_operation_mode(
-    user_input: dict[str, Any] = dict(),
+    user_input: Mapping[str, Any] = _EMPTY,
 ) -> vol.Schema:
     """Create a form for the 'operation_mode' step"""
 
@@ -300,8 +420,9 @@ def _create_form_operation_mode(
     return vol.Schema(schema)
 
 
+@_memoize_form
 def _create_form_times(
-    user_input: dict[str, Any] = dict(),
+    user_input: Mapping[str, Any] = _EMPTY,
 ) -> vol.Schema:
     """Create a form for the 'times' step"""
 
@@ -329,26 +450,40 @@ def _create_form_times(
     return vol.Schema(schema)
 
 
+# Interfaces selectors: interfaces -> validator
+_MULTISELECT_CACHE: dict[tuple[str, ...], cv.multi_select] = {}
+
+
+def _multi_select_interfaces(
+    interfaces: tuple[str, ...],
+) -> cv.multi_select:
+    """Get the interfaces selector, created once per list of interfaces"""
+
+    if interfaces not in _MULTISELECT_CACHE:
+        _MULTISELECT_CACHE[interfaces] = cv.multi_select({k: k for k in interfaces})
+
+    return _MULTISELECT_CACHE[interfaces]
+
+
 def _create_form_interfaces(
-    user_input: dict[str, Any] = dict(),
-    default: list[str] = list(),
+    user_input: Mapping[str, Any] = _EMPTY,
+    default: list[str] | None = None,
 ) -> vol.Schema:
     """Create a form for the 'interfaces' step"""
 
     schema = {
         vol.Required(
             CONF_INTERFACES,
-            default = default,
-        ): cv.multi_select(
-            {k: k for k in user_input["interfaces"]}
-        ),
+            default = default or [],
+        ): _multi_select_interfaces(tuple(user_input["interfaces"])),
     }
 
     return vol.Schema(schema)
 
 
+@_memoize_form
 def _create_form_name(
-    user_input: dict[str, Any] = dict(),
+    user_input: Mapping[str, Any] = _EMPTY,
 ) -> vol.Schema:
     """Create a form for the 'name' step"""
 
@@ -364,8 +499,9 @@ def _create_form_name(
     return vol.Schema(schema)
 
 
+@_memoize_form
 def _create_form_confirmation(
-    user_input: dict[str, Any] = dict(),
+    user_input: Mapping[str, Any] = _EMPTY,
 ) -> vol.Schema:
     """Create a form for the 'confirmation' step"""
 
@@ -389,43 +525,101 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
     def __init__(self):
         """Initialise config flow"""
 
-        self._configs = dict()
-        self._options = dict()
+        self._configs = {}
+        self._options = {}
         self._unique_id: str | None = None
         self._simple = False
+        self._api: ARBridge | None = None
+        # Network interfaces of the device by host. Requested in background
+        self._interfaces: dict[str, asyncio.Task[list[str]]] = {}
 
         # Dictionary last_step: next_step
         self._steps = {
             "discovery": self.async_step_credentials,
             "credentials": self.async_step_operation_mode,
-            "credentials_error": self.async_step_device,
             "device": self.async_step_operation_mode,
             "operation_mode": self.async_step_times,
             "times": self.async_step_interfaces,
             "interfaces": self.async_step_name,
             "name": self.async_step_finish,
         }
+        # Dictionary last_step: next_step on errors
+        self._error_steps = {
+            "credentials": self.async_step_device,
+        }
 
 
     async def async_select_step(
         self,
         last_step: str | None = None,
-        errors: dict[str, Any] = dict(),
+        errors: Mapping[str, Any] = _EMPTY,
     ) -> FlowResult:
         """Step selector"""
 
         if last_step:
             if last_step in self._steps:
                 if _check_errors(errors):
-                    return await self._steps["{}_error".format(last_step)](errors = errors)
+                    return await self._error_steps[last_step](errors = errors)
                 else:
                     return await self._steps[last_step]()
             else:
-                raise ValueError("Unknown value of last_step: {}".format(last_step))
+                raise ValueError(f"Unknown value of last_step: {last_step}")
         else:
             raise ValueError("Step name was not provided")
 
 
+    async def _async_set_api(
+        self,
+        api: ARBridge | None,
+    ) -> None:
+        """Replace the bridge used by the flow"""
+
+        if api is not self._api:
+            await _async_close_bridge(self._api)
+        self._api = api
+
+
+    @callback
+    def _async_prefetch_interfaces(self) -> None:
+        """Start getting network interfaces while the user fills in the next steps"""
+
+        host = self._configs[CONF_HOST]
+        if (task := self._interfaces.pop(host, None)) is not None:
+            task.cancel()
+
+        self._interfaces[host] = self.hass.async_create_task(
+            _async_get_network_interfaces(self.hass, self._configs, self._options, api = self._api)
+        )
+
+
+    async def _async_get_interfaces(self) -> list[str]:
+        """Get network interfaces of the device only once per flow"""
+
+        host = self._configs[CONF_HOST]
+        if host not in self._interfaces:
+            self._async_prefetch_interfaces()
+
+        return await self._interfaces[host]
+
+
+    @callback
+    def _async_cancel_interfaces(self) -> None:
+        """Cancel requests for network interfaces still in progress"""
+
+        for task in self._interfaces.values():
+            task.cancel()
+
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the bridge when the flow is removed"""
+
+        self._async_cancel_interfaces()
+        if self._api is not None:
+            self.hass.async_create_task(_async_close_bridge(self._api))
+            self._api = None
+
+
     ### USER SETUP -->
 
 
@@ -447,11 +641,16 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
 
         step_id = "discovery"
 
-        errors = dict()
+        errors = {}
 
         if user_input:
-            # Check if host can be resolved
-            ip = await self.hass.async_add_executor_job(_check_host, user_input[CONF_HOST])
+            # Check if host can be resolved. IP addresses need no resolution
+            host = user_input[CONF_HOST]
+            try:
+                ipaddress.ip_address(host)
+                ip = host
+            except ValueError:
+                ip = await _async_resolve_host(self.hass, host)
             if not ip:
                 errors["base"] = "cannot_resolve_host"
 
@@ -460,7 +659,7 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
                 return await self.async_select_step(step_id, errors)
 
         if not user_input:
-            user_input = dict()
+            user_input = {}
 
         return self.async_show_form(
             step_id = step_id,
@@ -478,24 +677,24 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
 
         step_id = "credentials"
 
-        errors = dict()
+        errors = {}
 
         if user_input:
             self._options.update(user_input)
             result = await _async_check_connection(self.hass, self._configs, self._options, simple = True)
             if "errors" in result:
                 errors["base"] = result["errors"]
-                if (errors["base"] != RESULT_WRONG_CREDENTIALS
-                    and errors["base"] != RESULT_LOGIN_BLOCKED
-                ):
+                if errors["base"] not in _NON_FATAL_LOGIN_ERRORS:
                     return await self.async_select_step(step_id, errors)
             else:
                 self._options.update(result["configs"])
+                await self._async_set_api(result["api"])
+                self._async_prefetch_interfaces()
                 await self.async_set_unique_id(result["unique_id"])
                 return await self.async_select_step(step_id, errors)
                 
         if not user_input:
-            user_input = self._options.copy()
+            user_input = self._options
 
         return self.async_show_form(
             step_id = step_id,
@@ -508,12 +707,14 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
     async def async_step_device(
         self,
         user_input: dict[str, Any] | None = None,
-        errors: dict[str, str] = dict(),
+        errors: Mapping[str, str] = _EMPTY,
     ) -> FlowResult:
         """Step to completely setup the device"""
 
         step_id = "device"
 
+        errors = dict(errors)
+
         if user_input:
             self._options.update(user_input)
             result = await _async_check_connection(self.hass, self._configs, self._options)
@@ -521,11 +722,13 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
                 errors["base"] = result["errors"]
             else:
                 self._options.update(result["configs"])
+                await self._async_set_api(result["api"])
+                self._async_prefetch_interfaces()
                 await self.async_set_unique_id(result["unique_id"])
                 return await self.async_select_step(step_id, errors)
                 
         if not user_input:
-            user_input = self._options.copy()
+            user_input = self._options
 
         return self.async_show_form(
             step_id = step_id,
@@ -544,7 +747,7 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
         step_id = "operation_mode"
 
         if not user_input:
-            user_input = self._options.copy()
+            user_input = self._options
             return self.async_show_form(
                 step_id = step_id,
                 data_schema = _create_form_operation_mode(user_input),
@@ -565,7 +768,7 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
         step_id = "times"
 
         if not user_input:
-            user_input = self._options.copy()
+            user_input = self._options
             return self.async_show_form(
                 step_id = step_id,
                 data_schema = _create_form_times(user_input),
@@ -588,7 +791,7 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
         if self._options.get(CONF_ENABLE_MONITOR, DEFAULT_ENABLE_MONITOR):
             if not user_input:
                 user_input = self._options.copy()
-                user_input["interfaces"] = await _async_get_network_interfaces(self.hass, self._configs, self._options)
+                user_input["interfaces"] = await self._async_get_interfaces()
                 return self.async_show_form(
                     step_id = step_id,
                     data_schema = _create_form_interfaces(user_input),
@@ -609,7 +812,7 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
         step_id = "name"
 
         if not user_input:
-            user_input = dict()
+            user_input = {}
             return self.async_show_form(
                 step_id = step_id,
                 data_schema = _create_form_name(user_input),
@@ -627,6 +830,9 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
     ) -> FlowResult:
         """Finish setup"""
 
+        self._async_cancel_interfaces()
+        await self._async_set_api(None)
+
         return self.async_create_entry(
             title = self._configs[CONF_HOST],
             data = self._configs,
@@ -644,6 +850,17 @@ class ASUSRouterFlowHandler(config_entries.ConfigFlow, domain = DOMAIN):
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Options flow for AsusRouter"""
 
+    # Steps which can be selected to change options
+    _OPTIONS_SCHEMA = vol.Schema(
+        {
+            vol.Optional(
+                el,
+                default = False,
+            ): bool
+            for el in ("device", "operation_mode", "times", "interfaces")
+        }
+    )
+
     def __init__(
         self,
         config_entry: config_entries.ConfigEntry,
@@ -652,10 +869,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         self.config_entry = config_entry
 
-        self._selection = dict()
+        self._selection = {}
         self._configs: dict[str, Any] = self.config_entry.data.copy()
         self._host: str = self._configs[CONF_HOST]
         self._options: dict[str, Any] = self.config_entry.options.copy()
+        self._api: ARBridge | None = None
+        # Network interfaces of the device by host
+        self._interfaces: dict[str, list[str]] = {}
 
         # Dictionary last_step: next_step
         self._steps = {
@@ -666,27 +886,59 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             "interfaces": self.async_step_confirmation,
             "confirmation": self.async_step_finish,
         }
+        # Dictionary last_step: next_step on errors
+        self._error_steps = {}
 
 
     async def async_select_step(
         self,
         last_step: str | None = None,
-        errors: dict[str, Any] = dict(),
+        errors: Mapping[str, Any] = _EMPTY,
     ) -> FlowResult:
         """Step selector"""
 
         if last_step:
             if last_step in self._steps:
                 if _check_errors(errors):
-                    return await self._steps["{}_error".format(last_step)](errors = errors)
+                    return await self._error_steps[last_step](errors = errors)
                 else:
                     return await self._steps[last_step]()
             else:
-                raise ValueError("Unknown value of last_step: {}".format(last_step))
+                raise ValueError(f"Unknown value of last_step: {last_step}")
         else:
             raise ValueError("Step name was not provided")
 
 
+    async def _async_set_api(
+        self,
+        api: ARBridge | None,
+    ) -> None:
+        """Replace the bridge used by the flow"""
+
+        if api is not self._api:
+            await _async_close_bridge(self._api)
+        self._api = api
+
+
+    async def _async_get_interfaces(self) -> list[str]:
+        """Get network interfaces of the device only once per flow"""
+
+        host = self._configs[CONF_HOST]
+        if host not in self._interfaces:
+            self._interfaces[host] = await _async_get_network_interfaces(self.hass, self._configs, self._options, api = self._api)
+
+        return self._interfaces[host]
+
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the bridge when the flow is removed"""
+
+        if self._api is not None:
+            self.hass.async_create_task(_async_close_bridge(self._api))
+            self._api = None
+
+
     async def async_step_init(
         self,
         user_input: dict[str, Any] | None = None,
@@ -708,27 +960,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             self._selection.update(user_input)
             return await self.async_select_step(step_id)
 
-        if not user_input:
-            user_input = self._selection.copy()
-
-
-        schema_dict = dict()
-        for el in self._steps:
-            if el != step_id and el != "confirmation":
-                schema_dict.update(
-                    {
-                        vol.Optional(
-                            el,
-                            default = False
-                        ): bool
-                    }
-                )
-
         return self.async_show_form(
             step_id = step_id,
-            data_schema = vol.Schema (
-                schema_dict
-            ),
+            data_schema = self._OPTIONS_SCHEMA,
         )
 
 
@@ -740,11 +974,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         step_id = "device"
 
-        errors = dict()
+        errors = {}
 
-        if (not step_id in self._selection
-            or self._selection[step_id] == False
-        ):
+        if not self._selection.get(step_id):
             return await self.async_select_step(step_id)
 
         if user_input:
@@ -754,10 +986,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 errors["base"] = result["errors"]
             else:
                 self._options.update(result["configs"])
+                await self._async_set_api(result["api"])
                 return await self.async_select_step(step_id, errors)
                 
         if not user_input:
-            user_input = self._options.copy()
+            user_input = self._options
 
         return self.async_show_form(
             step_id = step_id,
@@ -774,13 +1007,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         step_id = "operation_mode"
 
-        if (not step_id in self._selection
-            or self._selection[step_id] == False
-        ):
+        if not self._selection.get(step_id):
             return await self.async_select_step(step_id)
 
         if not user_input:
-            user_input = self._options.copy()
+            user_input = self._options
             return self.async_show_form(
                 step_id = step_id,
                 data_schema = _create_form_operation_mode(user_input),
@@ -799,13 +1030,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         step_id = "times"
 
-        if (not step_id in self._selection
-            or self._selection[step_id] == False
-        ):
+        if not self._selection.get(step_id):
             return await self.async_select_step(step_id)
 
         if not user_input:
-            user_input = self._options.copy()
+            user_input = self._options
             return self.async_show_form(
                 step_id = step_id,
                 data_schema = _create_form_times(user_input),
@@ -824,20 +1053,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         step_id = "interfaces"
 
-        if (not step_id in self._selection
-            or self._selection[step_id] == False
-        ):
+        if not self._selection.get(step_id):
             return await self.async_select_step(step_id)
 
         if self._options.get(CONF_ENABLE_MONITOR, DEFAULT_ENABLE_MONITOR):
             if not user_input:
                 user_input = self._options.copy()
-                selected = user_input["interfaces"].copy()
-                interfaces = await _async_get_network_interfaces(self.hass, self._configs, self._options)
+                selected = user_input["interfaces"]
+                interfaces = await self._async_get_interfaces()
                 # If interface was tracked, but cannot be found now, still add it
-                for interface in interfaces:
-                    if not interface in user_input["interfaces"]:
-                        user_input["interfaces"].append(interface)
+                tracked = set(selected)
+                user_input["interfaces"] = selected + [interface for interface in interfaces if interface not in tracked]
                 return self.async_show_form(
                     step_id = step_id,
                     data_schema = _create_form_interfaces(user_input, default = selected),
@@ -856,18 +1082,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         step_id = "confirmation"
 
-        errors = dict()
+        errors = {}
 
         if user_input:
-            if (CONF_CONFIRM in user_input
-                and user_input[CONF_CONFIRM] == True
-            ):
+            if user_input.get(CONF_CONFIRM) is True:
                 return await self.async_select_step(step_id)
             else:
                 errors['base'] = "not_confirmed"
 
         if not user_input:
-            user_input = self._options.copy()
+            user_input = self._options
 
         return self.async_show_form(
             step_id = step_id,
@@ -883,6 +1107,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Finish setup"""
 
+        await self._async_set_api(None)
+
         return self.async_create_entry(
             title = self.config_entry.title,
             data = self._options,
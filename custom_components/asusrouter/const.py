@@ -78,13 +78,18 @@ SENSORS_TYPE_PORTS = "ports"
 SENSORS_TYPE_RAM = "ram"
 SENSORS_TYPE_WAN = "wan"
 
+# Sensors update tiers. Slow tier is updated every SENSORS_TIER_SLOW_FACTOR scans
+SENSORS_TIER_FAST = "fast"
+SENSORS_TIER_SLOW = "slow"
+SENSORS_TIER_SLOW_FACTOR = 4
+
 # Sensors
 SENSORS_CHANGE = ["change"]
 SENSORS_CONNECTED_DEVICES = ["number"]
 SENSORS_CPU = ["total", "core_1", "core_2", "core_3", "core_4", "core_5", "core_6", "core_7", "core_8"]
 SENSORS_MISC = ["boottime"]
 SENSORS_NETWORK_STAT = ["rx", "tx", "rx_speed", "tx_speed"]
-SENSORS_PORTS = ["WAN", "LAN"]
+SENSORS_PORTS = ("WAN", "LAN")
 SENSORS_RAM = ["total", "free", "used", "usage"]
 SENSORS_WAN = ["status", "ip", "ip_type", "gateway", "mask", "dns", "private_subnet"]
 
@@ -106,11 +111,21 @@ STEP_TYPE_SIMPLE = "simplified"
 CONVERT_TO_MEGA = 1048576
 CONVERT_TO_GIGA = 1073741824
 
+# Time to keep resolved (and not resolved) hostnames, seconds
+DNS_TTL = 300
+DNS_TTL_NEGATIVE = 30
+
 
 # Keys
 KEY_COORDINATOR = "coordinator"
 
 
+# Storage of the device labels
+STORAGE_LABELS_DELAY = 10
+STORAGE_LABELS_KEY = "{}.labels_{}"
+STORAGE_LABELS_VERSION = 1
+
+
 # Params to generate sensors
 KEY_SENSOR_ID = "{}_{}"
 
@@ -5,8 +5,10 @@ from __future__ import annotations
 import logging
 _LOGGER = logging.getLogger(__name__)
 
+import asyncio
 from collections.abc import Callable, Awaitable
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Any, TypeVar
 
 from homeassistant.components.device_tracker.const import (
@@ -53,8 +55,10 @@ from .const import (
     DEFAULT_VERIFY_SSL,
     DOMAIN,
     KEY_COORDINATOR,
-    DEFAULT_SCAN_INTERVAL,
     SENSORS_CONNECTED_DEVICES,
+    SENSORS_TIER_FAST,
+    SENSORS_TIER_SLOW,
+    SENSORS_TIER_SLOW_FACTOR,
     SENSORS_TYPE_DEVICES,
 )
 
@@ -69,14 +73,22 @@ class AsusRouterSensorHandler:
         self,
         hass: HomeAssistant,
         api: ARBridge,
-        scan_interval: int = DEFAULT_SCAN_INTERVAL,
     ) -> None:
         """Initialise data handler"""
 
         self._hass = hass
         self._api = api
         self._connected_devices = 0
-        self._scan_interval = timedelta(seconds = scan_interval)
+
+        # Polled sensor types are updated together by `async_update`
+        self._methods: dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._tiers: dict[str, str] = {}
+        self._coordinators: dict[str, DataUpdateCoordinator] = {}
+        self._data: dict[str, Any] = {}
+        self._tick = 0
+
+        # Batch updates must not overlap, since they share the data above
+        self._lock = asyncio.Lock()
 
 
     async def _get_connected_devices(self) -> dict[str, int]:
@@ -85,6 +97,22 @@ class AsusRouterSensorHandler:
         return {SENSORS_CONNECTED_DEVICES[0]: self._connected_devices}
 
 
+    async def _get_sensors_data(
+        self,
+        sensor_type: str,
+    ) -> Any:
+        """Return data of the sensor type from the last batch update"""
+
+        if sensor_type in self._data:
+            data = self._data.pop(sensor_type)
+            if isinstance(data, Exception):
+                raise data
+            return data
+
+        # Refresh requested outside of the batch update
+        return await self._methods[sensor_type]()
+
+
     def update_device_count(
         self,
         conn_devices: int,
@@ -101,16 +129,16 @@ class AsusRouterSensorHandler:
         self,
         sensor_type: str,
         update_method: Callable[[], Awaitable[_T]] | None = None,
+        tier: str = SENSORS_TIER_FAST,
     ) -> DataUpdateCoordinator:
         """Find coordinator for the sensor type"""
 
-        should_poll = True
-
         if sensor_type == SENSORS_TYPE_DEVICES:
-            should_poll = False
             method = self._get_connected_devices
         elif update_method is not None:
-            method = update_method
+            self._methods[sensor_type] = update_method
+            self._tiers[sensor_type] = tier
+            method = partial(self._get_sensors_data, sensor_type)
         else:
             raise RuntimeError("Unknown sensor type: {}".format(sensor_type))
 
@@ -119,13 +147,39 @@ class AsusRouterSensorHandler:
             _LOGGER,
             name = sensor_type,
             update_method = method,
-            update_interval = self._scan_interval if should_poll else None,
+            update_interval = None,
         )
-        await coordinator.async_refresh()
+        self._coordinators[sensor_type] = coordinator
+
+        # Polled coordinators get their first data with `async_update`
+        if sensor_type not in self._methods:
+            await coordinator.async_refresh()
 
         return coordinator
 
 
+    async def async_update(self) -> None:
+        """Update all the polled coordinators with a single batch of requests"""
+
+        if not self._methods:
+            return
+
+        async with self._lock:
+            slow = self._tick % SENSORS_TIER_SLOW_FACTOR == 0
+            self._tick += 1
+
+            methods = {
+                sensor_type: method
+                for sensor_type, method in self._methods.items()
+                if slow or self._tiers[sensor_type] != SENSORS_TIER_SLOW
+            }
+
+            self._api.begin_tick()
+            self._data = await self._api.async_fetch_all(methods)
+            for sensor_type in methods:
+                await self._coordinators[sensor_type].async_refresh()
+
+
 class AsusRouterDevInfo:
     """Representation of an AsusRouter device info"""
 
@@ -263,11 +317,11 @@ class AsusRouterObj:
         if not self._api.is_connected:
             raise ConfigEntryNotReady
 
-        self._mac = await self._api.get_mac()
-        self._serial = await self._api.get_serial()
-        self._model = await self._api.get_model()
-        self._vendor = await self._api.get_vendor()
-        self._firmware = await self._api.get_firmware()
+        self._mac = self._api.mac
+        self._serial = self._api.serial
+        self._model = self._api.model
+        self._vendor = self._api.vendor
+        self._firmware = self._api.firmware
 
         if self._model is not None:
             if (
@@ -321,7 +375,11 @@ class AsusRouterObj:
     ) -> None:
         """Update all AsusRouter platforms"""
 
-        await self.update_devices()
+        # Polled sensors do not depend on the devices list
+        try:
+            await self.update_devices()
+        finally:
+            await self.update_sensors()
 
 
     async def update_devices(self) -> None:
@@ -372,21 +430,36 @@ class AsusRouterObj:
         if self._sensors_data_handler:
             return
 
-        self._sensors_data_handler = AsusRouterSensorHandler(self.hass, self._api, self._options[CONF_SCAN_INTERVAL])
+        self._sensors_data_handler = AsusRouterSensorHandler(self.hass, self._api)
         self._sensors_data_handler.update_device_count(self._connected_devices)
 
-        sensors_types = await self._api.async_get_available_sensors()
+        sensors_types = (await self._api.async_get_available_sensors()).copy()
         sensors_types[SENSORS_TYPE_DEVICES] = {"sensors": SENSORS_CONNECTED_DEVICES}
 
         for sensor_type, sensor_def in sensors_types.items():
             if not (sensor_names:= sensor_def.get("sensors")):
                 continue
-            coordinator = await self._sensors_data_handler.get_coordinator(sensor_type, update_method = sensor_def.get("method"))
+            coordinator = await self._sensors_data_handler.get_coordinator(
+                sensor_type,
+                update_method = sensor_def.get("method"),
+                tier = sensor_def.get("tier", SENSORS_TIER_FAST),
+            )
             self._sensors_coordinator[sensor_type] = {
                 KEY_COORDINATOR: coordinator,
                 sensor_type: sensor_names,
             }
 
+        await self.update_sensors()
+
+
+    async def update_sensors(self) -> None:
+        """Update AsusRouter polled sensors"""
+
+        if not self._sensors_data_handler:
+            return
+
+        await self._sensors_data_handler.async_update()
+
 
     async def _update_unpolled_sensors(self) -> None:
         """Request refresh for AsusRouter unpolled sensors."""